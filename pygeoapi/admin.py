@@ -39,7 +39,8 @@ from typing import Any, Tuple, Union
 
 from pygeoapi.api import API, APIRequest, F_HTML, pre_process
 
-from pygeoapi.config import get_config, validate_config
+from pygeoapi.config import (clear_config_cache, get_config,
+                             validate_config)
 from pygeoapi.openapi import get_oas
 # from pygeoapi.openapi import validate_openapi_document
 from pygeoapi.util import to_json, render_j2_template, yaml_dump
@@ -138,6 +139,8 @@ class Admin(API):
         # write pygeoapi configuration
         LOGGER.debug('Writing pygeoapi configuration')
         yaml_dump(config, self.PYGEOAPI_CONFIG)
+        # the file's stamp may not change for writes in quick succession
+        clear_config_cache()
         LOGGER.debug('Finished writing pygeoapi configuration')
 
     def write_oas(self, config):
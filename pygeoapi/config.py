@@ -30,17 +30,46 @@
 # =================================================================
 
 import click
+import functools
 import json
-from jsonschema import validate as jsonschema_validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 import logging
 import os
+import pickle
 import yaml
 
-from pygeoapi.util import to_json, yaml_load, THISDIR
+from pygeoapi.util import SafeLoader, json_serial, yaml_load, THISDIR
 
 LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config(config_file: str, stamp: tuple, raw: bool,
+                 env: frozenset = None) -> dict:
+    """
+    Parse a pygeoapi configuration file
+
+    Results are memoized; `stamp` (the file's mtime and size) and `env`
+    (the environment variables used for interpolation) are part of the
+    key so that a modified file or environment is parsed again.
+
+    :param config_file: path to configuration file
+    :param stamp: `tuple` of file modification time (ns) and size
+    :param raw: `bool` over interpolation during config loading
+    :param env: `frozenset` of environment variable items (`None` if raw)
+
+    :returns: `dict` of pygeoapi configuration (shared, do not modify)
+    """
+
+    LOGGER.debug(f'Loading configuration from {config_file}')
+    with open(config_file, encoding='utf8') as fh:
+        if raw:
+            return yaml.load(fh, Loader=SafeLoader)
+        else:
+            return yaml_load(fh)
+
+
 def get_config(raw: bool = False) -> dict:
     """
     Get pygeoapi configurations
@@ -50,20 +79,38 @@ def get_config(raw: bool = False) -> dict:
     :returns: `dict` of pygeoapi configuration
     """
 
-    if not os.environ.get('PYGEOAPI_CONFIG'):
+    config_file = os.environ.get('PYGEOAPI_CONFIG')
+    if not config_file:
         raise RuntimeError('PYGEOAPI_CONFIG environment variable not set')
 
-    with open(os.environ.get('PYGEOAPI_CONFIG'), encoding='utf8') as fh:
-        if raw:
-            CONFIG = yaml.safe_load(fh)
-        else:
-            CONFIG = yaml_load(fh)
+    stat = os.stat(config_file)
+    env = None if raw else frozenset(os.environ.items())
+    CONFIG = _load_config(
+        config_file, (stat.st_mtime_ns, stat.st_size), raw, env)
+
+    # a pickle round-trip is a faster deep copy for plain YAML data
+    # (it keeps dates and shared YAML anchors, unlike JSON)
+    return pickle.loads(pickle.dumps(CONFIG, pickle.HIGHEST_PROTOCOL))
+
+
+def clear_config_cache() -> None:
+    """
+    Clear cached pygeoapi configurations (e.g. after writing the file)
+
+    :returns: `None`
+    """
 
-    return CONFIG
+    _load_config.cache_clear()
 
 
+@functools.cache
 def load_schema() -> dict:
-    """ Reads the JSON schema YAML file. """
+    """
+    Reads the JSON schema YAML file
+
+    The schema is parsed once per process; the returned `dict` is shared
+    and must not be modified.
+    """
 
     schema_file = THISDIR / 'schemas' / 'config' / 'pygeoapi-config-0.x.yml'
 
@@ -71,6 +118,56 @@ def load_schema() -> dict:
         return yaml_load(fh2)
 
 
+def _to_json_types(obj):
+    """
+    Coerce an object to the types a JSON round-trip (`to_json`) would
+    produce, without serializing it
+
+    :param obj: `object` to be coerced
+
+    :returns: `obj` itself if already JSON compatible, else a coerced copy
+    """
+
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    elif isinstance(obj, dict):
+        changed = False
+        dict_ = {}
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                # same key coercion as json.dumps
+                key = json.dumps(key)
+                changed = True
+            dict_[key] = value2 = _to_json_types(value)
+            changed = changed or value2 is not value
+        return dict_ if changed else obj
+    elif isinstance(obj, (list, tuple)):
+        list_ = [_to_json_types(value) for value in obj]
+        if isinstance(obj, list) and all(
+                a is b for a, b in zip(list_, obj)):
+            return obj
+        return list_
+    else:
+        return _to_json_types(json_serial(obj))
+
+
+@functools.cache
+def _get_validator():
+    """
+    Build the JSON schema validator for pygeoapi configurations
+
+    The schema is checked and the validator compiled once per process.
+
+    :returns: `jsonschema` validator instance
+    """
+
+    schema = load_schema()
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+
+    return cls(schema)
+
+
 def validate_config(instance_dict: dict) -> bool:
     """
     Validate pygeoapi configuration against pygeoapi schema
@@ -80,7 +177,11 @@ def validate_config(instance_dict: dict) -> bool:
     :returns: `bool` of validation
     """
 
-    jsonschema_validate(json.loads(to_json(instance_dict)), load_schema())
+    error = best_match(
+        _get_validator().iter_errors(_to_json_types(instance_dict)))
+
+    if error is not None:
+        raise error
 
     return True
 
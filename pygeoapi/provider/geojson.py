@@ -31,13 +31,126 @@
 import json
 import logging
 import os
+import pickle
 import uuid
 
+import shapely
+from shapely.geometry import box, shape
+
 from pygeoapi.provider.base import BaseProvider, ProviderItemNotFoundError
 from pygeoapi.util import crs_transform
 
 LOGGER = logging.getLogger(__name__)
 
+# JSON value types to field types; exact type lookup, so that bool is not
+# taken for int
+TYPE_MAP = {
+    bool: 'boolean',
+    float: 'number',
+    int: 'integer'
+}
+
+
+def _deepcopy(obj):
+    """
+    Deep copy deserialized JSON data
+
+    :param obj: `dict` or `list` of JSON types
+
+    :returns: deep copy of `obj` (a pickle round-trip is faster than
+              `copy.deepcopy` for plain JSON types)
+    """
+
+    return pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+
+
+# GeoJSON files cached by path; each entry holds the file's stamp, the
+# parsed FeatureCollection and the indexes built from it
+_CACHE = {}
+
+
+def _read_geojson(filepath: str, stamp: tuple) -> dict:
+    """
+    Read and deserialize a GeoJSON file
+
+    Results are cached across provider instances, one entry per file;
+    the entry is replaced when `stamp` (the file's mtime and size)
+    changes, so only the current version of a file is held in memory.
+
+    :param filepath: path to GeoJSON file
+    :param stamp: `tuple` of file modification time (ns) and size
+
+    :returns: `dict` cache entry, with the GeoJSON FeatureCollection
+              (shared, must not be modified) under 'data'
+    """
+
+    entry = _CACHE.get(filepath)
+    if entry is not None and entry['stamp'] == stamp:
+        return entry
+
+    # release the stale version before parsing the new one
+    _CACHE.pop(filepath, None)
+    entry = None
+
+    LOGGER.debug(f'Reading {filepath}')
+    with open(filepath) as src:
+        entry = {'stamp': stamp, 'data': json.loads(src.read()), 'ids': {}}
+
+    _CACHE[filepath] = entry
+    return entry
+
+
+def _index_geojson(entry: dict, id_field: str) -> dict:
+    """
+    Index the features of a GeoJSON file by id
+
+    The index is cached with the document it was built from.
+
+    :param entry: `dict` cache entry of the GeoJSON file
+                  (see `_read_geojson`)
+    :param id_field: name of the property holding feature ids
+
+    :returns: `dict` of `str` id to (shared) GeoJSON feature
+    """
+
+    if id_field in entry['ids']:
+        return entry['ids'][id_field]
+
+    index = {}
+    for feature in entry['data']['features']:
+        if 'id' in feature:
+            id_ = feature['id']
+        else:
+            id_ = (feature.get('properties') or {}).get(id_field)
+        # first feature wins on duplicate ids
+        index.setdefault(str(id_), feature)
+
+    entry['ids'][id_field] = index
+    return index
+
+
+def _spatial_index(entry: dict) -> shapely.STRtree:
+    """
+    Build an R-tree of the feature geometries of a GeoJSON file
+
+    Tree indices are positions in the document's list of features;
+    features without geometry are not indexed. The tree is cached with
+    the document it was built from.
+
+    :param entry: `dict` cache entry of the GeoJSON file
+                  (see `_read_geojson`)
+
+    :returns: `shapely.STRtree` of feature geometries
+    """
+
+    if 'tree' not in entry:
+        LOGGER.debug('Building spatial index')
+        entry['tree'] = shapely.STRtree([
+            shape(f['geometry']) if f.get('geometry') else None
+            for f in entry['data']['features']])
+
+    return entry['tree']
+
 
 class GeoJSONProvider(BaseProvider):
     """Provider class backed by local GeoJSON files
@@ -46,7 +159,8 @@ class GeoJSONProvider(BaseProvider):
     (no external services, no dependencies, no schema)
 
     at the expense of performance
-    (no indexing, full serialization roundtrip on each request)
+    (the whole file is held in memory and parsed again when it changes;
+    features are indexed by id and, for bbox queries, with an R-tree)
 
     Not thread safe, a single server process is assumed
 
@@ -55,7 +169,6 @@ class GeoJSONProvider(BaseProvider):
     The feature 'properties' will be preserved.
 
     TODO:
-    * query method should take bbox
     * instead of methods returning FeatureCollections,
     we should be yielding Features and aggregating in the view
     * there are strict id semantics; all features in the input GeoJSON file
@@ -79,56 +192,172 @@ class GeoJSONProvider(BaseProvider):
 
         fields = {}
         LOGGER.debug('Treating all columns as string types')
-        if os.path.exists(self.data):
-            with open(self.data) as src:
-                data = json.loads(src.read())
+        # shares the cached document with _load
+        data = self._read()['data']
+        if data['features']:
             for key, value in data['features'][0]['properties'].items():
-                if isinstance(value, float):
-                    type_ = 'number'
-                elif isinstance(value, int):
-                    type_ = 'integer'
-                else:
-                    type_ = 'string'
-
-                fields[key] = {'type': type_}
-        else:
-            LOGGER.warning(f'File {self.data} does not exist.')
+                fields[key] = {'type': TYPE_MAP.get(type(value), 'string')}
         return fields
 
-    def _load(self, skip_geometry=None, properties=[], select_properties=[]):
-        """Load and validate the source GeoJSON file
+    def _stamp(self):
+        """Get the modification stamp of the source GeoJSON file
+
+        :returns: `tuple` of modification time (ns) and size,
+                  `None` if the file does not exist
+        """
+
+        try:
+            stat = os.stat(self.data)
+        except FileNotFoundError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read(self):
+        """Read and validate the source GeoJSON file
         at self.data
 
-        Yes loading from disk, deserializing and validation
-        happens on every request. This is not efficient.
+        The deserialized file is cached until it changes on disk;
+        the returned FeatureCollection is shared and must not be modified.
+
+        :returns: `dict` cache entry, with the FeatureCollection under
+                  'data' (see `_read_geojson`)
         """
 
-        if os.path.exists(self.data):
-            with open(self.data) as src:
-                data = json.loads(src.read())
+        stamp = self._stamp()
+        if stamp is not None:
+            entry = _read_geojson(self.data, stamp)
         else:
             LOGGER.warning(f'File {self.data} does not exist.')
-            data = {
-                'type': 'FeatureCollection',
-                'features': []}
+            entry = {
+                'stamp': None,
+                'data': {
+                    'type': 'FeatureCollection',
+                    'features': []},
+                'ids': {}}
 
         # Must be a FeatureCollection
-        assert data['type'] == 'FeatureCollection'
+        assert entry['data']['type'] == 'FeatureCollection'
+
+        return entry
 
-        # filter by properties if set
-        if properties:
-            data['features'] = [f for f in data['features'] if \
-                all([str(f['properties'][p[0]]) == str(p[1]) for p in properties])]  # noqa
+    def _intersects(self, entry, bbox):
+        """Select the features intersecting a bounding box
+
+        :param entry: `dict` cache entry of the source file (see `_read`);
+                      the tree and the features come from the same read
+        :param bbox: bounding box [minx,miny,maxx,maxy]
+                     or [minx,miny,minz,maxx,maxy,maxz]
+
+        :returns: list of matching features (not copied), in file order
+        """
+
+        if len(bbox) == 6:
+            bbox = [bbox[0], bbox[1], bbox[3], bbox[4]]
+
+        minx, miny, maxx, maxy = bbox
+        if minx > maxx:
+            # antimeridian bbox, split at 180°
+            boxes = [box(minx, miny, 180, maxy), box(-180, miny, maxx, maxy)]
+        else:
+            boxes = [box(minx, miny, maxx, maxy)]
+
+        features = entry['data']['features']
+        tree = _spatial_index(entry)
+        matches = set()
+        for bbox_ in boxes:
+            matches.update(tree.query(bbox_, predicate='intersects'))
+
+        return [features[i] for i in sorted(matches)]
+
+    def _filter(self, features, properties=[]):
+        """Filter features by properties
+
+        :param features: list of GeoJSON features
+        :param properties: list of tuples (name, value)
+
+        :returns: list of matching features (not copied)
+        """
+
+        if not properties:
+            return features
+
+        # values are compared as strings; coerce the wanted ones once
+        wanted = [(name, str(value)) for name, value in properties]
+
+        return [f for f in features if all(
+            name in f['properties'] and str(f['properties'][name]) == value
+            for name, value in wanted)]
+
+    def _keep_properties(self, select_properties=[]):
+        """Get the names of the properties to output
+
+        :param select_properties: list of property names
+
+        :returns: `set` of property names, `None` for all properties
+        """
+
+        if self.properties or select_properties:
+            return set(self.properties) | set(select_properties)
+
+        return None
+
+    def _prepare(self, feature, skip_geometry=None, keep_properties=None):
+        """Copy a (cached) feature for output
+
+        :param feature: GeoJSON feature
+        :param skip_geometry: bool of whether to skip geometry
+        :param keep_properties: `set` of property names to output,
+                                `None` for all (see `_keep_properties`)
+
+        :returns: deep copy of feature which callers are free to modify
+        """
+
+        properties = feature.get('properties')
+        feature = feature.copy()
 
         # All features must have ids, TODO must be unique strings
-        for i in data['features']:
-            if 'id' not in i and self.id_field in i['properties']:
-                i['id'] = i['properties'][self.id_field]
-            if skip_geometry:
-                i['geometry'] = None
-            if self.properties or select_properties:
-                i['properties'] = {k: v for k, v in i['properties'].items()
-                                   if k in set(self.properties) | set(select_properties)}  # noqa
+        if 'id' not in feature and properties and \
+           self.id_field in properties:
+            feature['id'] = properties[self.id_field]
+        if skip_geometry:
+            feature['geometry'] = None
+        if properties and keep_properties is not None:
+            feature['properties'] = {k: v for k, v in properties.items()
+                                     if k in keep_properties}
+
+        # geometry, links and nested property values are still shared with
+        # the cached document
+        return _deepcopy(feature)
+
+    def _copy_collection(self, data):
+        """Copy the members of a (cached) FeatureCollection but its features
+
+        :param data: GeoJSON FeatureCollection
+
+        :returns: deep copy of the FeatureCollection without 'features'
+        """
+
+        return _deepcopy({key: value for key, value in data.items()
+                          if key != 'features'})
+
+    def _load(self, skip_geometry=None, properties=[], select_properties=[]):
+        """Load and validate the source GeoJSON file
+        at self.data
+
+        :returns: FeatureCollection dict of deep-copied features which
+                  callers are free to modify
+        """
+
+        keep_properties = self._keep_properties(select_properties)
+
+        data = self._read()['data']
+        features = self._filter(data['features'], properties)
+        data = self._copy_collection(data)
+        data['features'] = [
+            self._prepare(f, skip_geometry, keep_properties)
+            for f in features]
+
         return data
 
     @crs_transform
@@ -152,16 +381,24 @@ class GeoJSONProvider(BaseProvider):
         :returns: FeatureCollection dict of 0..n GeoJSON features
         """
 
-        # TODO filter by bbox without resorting to third-party libs
-        data = self._load(skip_geometry=skip_geometry, properties=properties,
-                          select_properties=select_properties)
+        entry = self._read()
+        data = entry['data']
+        features = data['features']
+        if bbox:
+            features = self._intersects(entry, bbox)
+        features = self._filter(features, properties)
 
-        data['numberMatched'] = len(data['features'])
+        data = self._copy_collection(data)
+        data['numberMatched'] = len(features)
 
         if resulttype == 'hits':
             data['features'] = []
         else:
-            data['features'] = data['features'][offset:offset+limit]
+            # only the requested page of features is copied
+            keep_properties = self._keep_properties(select_properties)
+            data['features'] = [
+                self._prepare(f, skip_geometry, keep_properties)
+                for f in features[offset:offset+limit]]
             data['numberReturned'] = len(data['features'])
 
         return data
@@ -175,11 +412,11 @@ class GeoJSONProvider(BaseProvider):
         :returns: dict of single GeoJSON feature
         """
 
-        all_data = self._load()
-        # if matches
-        for feature in all_data['features']:
-            if str(feature.get('id')) == identifier:
-                return feature
+        feature = _index_geojson(self._read(), self.id_field).get(identifier)
+        if feature is not None:
+            return self._prepare(
+                feature, keep_properties=self._keep_properties())
+
         # default, no match
         err = f'item {identifier} not found'
         LOGGER.error(err)
@@ -199,8 +436,7 @@ class GeoJSONProvider(BaseProvider):
 
         all_data['features'].append(new_feature)
 
-        with open(self.data, 'w') as dst:
-            dst.write(json.dumps(all_data))
+        self._write(all_data)
 
     def update(self, identifier, new_feature):
         """Updates an existing feature id with new_feature
@@ -219,8 +455,7 @@ class GeoJSONProvider(BaseProvider):
                 if feature['properties'][self.id_field] == identifier:
                     new_feature['properties'][self.id_field] = identifier
                     all_data['features'][i] = new_feature
-        with open(self.data, 'w') as dst:
-            dst.write(json.dumps(all_data))
+        self._write(all_data)
 
     def delete(self, identifier):
         """Deletes an existing feature
@@ -236,8 +471,19 @@ class GeoJSONProvider(BaseProvider):
             elif self.id_field in feature['properties']:
                 if feature['properties'][self.id_field] == identifier:
                     all_data['features'].pop(i)
+        self._write(all_data)
+
+    def _write(self, data):
+        """Serialize a FeatureCollection to the source GeoJSON file
+
+        :param data: GeoJSON FeatureCollection dictionary
+        """
+
         with open(self.data, 'w') as dst:
-            dst.write(json.dumps(all_data))
+            dst.write(json.dumps(data))
+
+        # the file's stamp may not change for writes in quick succession
+        _CACHE.pop(self.data, None)
 
     def __repr__(self):
         return f'<GeoJSONProvider> {self.data}'
@@ -48,7 +48,6 @@
 # gunzip < tests/data/hotosm_bdi_waterways.sql.gz |
 #  psql -U postgres -h 127.0.0.1 -p 5432 test
 
-from copy import deepcopy
 from datetime import datetime
 from decimal import Decimal
 import functools
@@ -285,7 +284,7 @@ class PostgreSQLProvider(BaseProvider):
             # Drop non-defined properties
             if self.properties:
                 props = feature['properties']
-                dropping_keys = deepcopy(props).keys()
+                dropping_keys = list(props)
                 for item in dropping_keys:
                     if item not in self.properties:
                         props.pop(item)
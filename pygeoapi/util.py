@@ -51,6 +51,8 @@ from urllib.request import urlopen
 import uuid
 
 import dateutil.parser
+import numpy
+import shapely
 from shapely import ops
 from shapely.geometry import (
     box,
@@ -66,6 +68,10 @@ from shapely.geometry import (
     mapping as geom_to_geojson,
 )
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 from babel.support import Translations
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 import pygeofilter.ast
@@ -192,7 +198,7 @@ def yaml_load(fh: IO) -> dict:
             result += raw_value[current_index:]
         return get_typed_value(result)
 
-    class EnvVarLoader(yaml.SafeLoader):
+    class EnvVarLoader(SafeLoader):
         pass
 
     EnvVarLoader.add_implicit_resolver('!env', env_matcher, None)
@@ -765,7 +771,79 @@ def get_transform_from_crs(
     crs_transform = pyproj.Transformer.from_crs(
         crs_in, crs_out, always_xy=always_xy,
     ).transform
-    return partial(ops.transform, crs_transform)
+    return partial(_transform_geometry, crs_transform)
+
+
+def _transform_coordinates(transform: Callable, coords):
+    """ Transform an array of coordinates in place.
+
+    :param transform: `pyproj.Transformer.transform` method.
+    :type transform: `callable`
+    :param coords: (N, 2) or (N, 3) array of coordinates.
+    :type coords: `numpy.ndarray`
+
+    :returns: The transformed array.
+    :rtype: `numpy.ndarray`
+    """
+    for i, values in enumerate(transform(*coords.T)):
+        coords[:, i] = values
+    return coords
+
+
+def _transform_geometry(transform: Callable, geom: GeomObject) -> GeomObject:
+    """ Transform the coordinates of Shapely geometrical object(s).
+
+    All coordinates of the geometry, or of an array of geometries, are
+    passed to pyproj in a single call (one per dimensionality).
+
+    :param transform: `pyproj.Transformer.transform` method.
+    :type transform: `callable`
+    :param geom: Geometrical object, or `numpy.ndarray` of geometrical
+        objects, to transform.
+    :type geom: `GeomObject`
+
+    :returns: The transformed geometrical object(s).
+    :rtype: `GeomObject`
+    """
+    transform_coords = partial(_transform_coordinates, transform)
+    has_z = shapely.has_z(geom)
+    if has_z.all() or not has_z.any():
+        return shapely.transform(
+            geom, transform_coords, include_z=bool(has_z.all()),
+        )
+
+    # Mixed 2D and 3D geometries
+    result = geom.copy()
+    result[has_z] = shapely.transform(
+        geom[has_z], transform_coords, include_z=True,
+    )
+    result[~has_z] = shapely.transform(
+        geom[~has_z], transform_coords, include_z=False,
+    )
+    return result
+
+
+@functools.lru_cache(maxsize=32)
+def _get_transform_from_wkt(
+    crs_in_wkt: str, crs_out_wkt: str
+) -> Callable[[GeomObject], GeomObject]:
+    """ Get (cached) transformation function from two CRS WKT strings.
+
+    Parsing the WKT and building the `pyproj.Transformer` is done once per
+    pair of CRSs instead of once per request.
+
+    :param crs_in_wkt: WKT of the input Coordinate Reference System.
+    :type crs_in_wkt: `str`
+    :param crs_out_wkt: WKT of the output Coordinate Reference System.
+    :type crs_out_wkt: `str`
+
+    :returns: Function to transform the coordinates of a `GeomObject`.
+    :rtype: `callable`
+    """
+    return get_transform_from_crs(
+        pyproj.CRS.from_wkt(crs_in_wkt),
+        pyproj.CRS.from_wkt(crs_out_wkt),
+    )
 
 
 def crs_transform(func):
@@ -807,9 +885,9 @@ def crs_transform(func):
             return result
         # Create transformation function and transform the output feature(s)'
         # coordinates before returning them.
-        transform_func = get_transform_from_crs(
-            pyproj.CRS.from_wkt(crs_transform_spec.source_crs_wkt),
-            pyproj.CRS.from_wkt(crs_transform_spec.target_crs_wkt),
+        transform_func = _get_transform_from_wkt(
+            crs_transform_spec.source_crs_wkt,
+            crs_transform_spec.target_crs_wkt,
         )
 
         LOGGER.debug(f'crs_transform: transforming features CRS '
@@ -823,9 +901,15 @@ def crs_transform(func):
             crs_transform_feature(result, transform_func)
         # Decorated function returns a FeatureCollection
         else:
-            # Transform all features' coordinates
-            for feature in features:
-                crs_transform_feature(feature, transform_func)
+            # Transform all features' coordinates at once
+            features = [feature for feature in features
+                        if feature.get('geometry') is not None]
+            geoms = numpy.array(
+                [geojson_to_geom(feature['geometry']) for feature in features],
+                dtype=object,
+            )
+            for feature, geom in zip(features, transform_func(geoms)):
+                feature['geometry'] = geom_to_geojson(geom)
         return result
     return get_geojsonf
 
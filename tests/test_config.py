@@ -33,7 +33,7 @@ from copy import deepcopy
 from jsonschema.exceptions import ValidationError
 import pytest
 
-from pygeoapi.config import validate_config
+from pygeoapi.config import clear_config_cache, get_config, validate_config
 from pygeoapi.util import yaml_load
 
 from .util import get_test_file_path
@@ -64,6 +64,34 @@ def test_config_envvars():
             yaml_load(fh)
 
 
+def test_get_config(tmp_path, monkeypatch):
+    config_file = tmp_path / 'config.yml'
+    config_file.write_text('server:\n    url: http://localhost:5000\n')
+    monkeypatch.setenv('PYGEOAPI_CONFIG', str(config_file))
+
+    config = get_config()
+    assert config['server']['url'] == 'http://localhost:5000'
+
+    # cached configurations are not shared between callers
+    config['server']['url'] = 'http://example.org'
+    assert get_config()['server']['url'] == 'http://localhost:5000'
+
+    # changes on disk are picked up
+    config_file.write_text('server:\n    url: http://localhost:5001/api\n')
+    assert get_config()['server']['url'] == 'http://localhost:5001/api'
+
+    # changes to the environment are picked up
+    config_file.write_text('server:\n    url: ${PYGEOAPI_URL}\n')
+    monkeypatch.setenv('PYGEOAPI_URL', 'http://localhost:5002')
+    assert get_config()['server']['url'] == 'http://localhost:5002'
+    monkeypatch.setenv('PYGEOAPI_URL', 'http://localhost:5003')
+    assert get_config()['server']['url'] == 'http://localhost:5003'
+    assert get_config(raw=True)['server']['url'] == '${PYGEOAPI_URL}'
+
+    clear_config_cache()
+    assert get_config()['server']['url'] == 'http://localhost:5003'
+
+
 def test_validate_config(config):
     is_valid = validate_config(config)
     assert is_valid
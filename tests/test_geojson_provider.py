@@ -50,7 +50,10 @@ def fixture():
                 'coordinates': [125.6, 10.1]},
             'properties': {
                 'name': 'Dinagat Islands',
-                'foo': 'bar'
+                'foo': 'bar',
+                'area': 1036.34,
+                'population': 127152,
+                'island': True
             }}
         ]
     }
@@ -74,8 +77,11 @@ def test_query(fixture, config):
     p = GeoJSONProvider(config)
 
     fields = p.get_fields()
-    assert len(fields) == 2
+    assert len(fields) == 5
     assert fields['name']['type'] == 'string'
+    assert fields['area']['type'] == 'number'
+    assert fields['population']['type'] == 'integer'
+    assert fields['island']['type'] == 'boolean'
 
     results = p.query()
     assert len(results['features']) == 1
@@ -94,6 +100,112 @@ def test_query(fixture, config):
     assert results['numberMatched'] == 1
     assert results['numberReturned'] == 1
 
+    results = p.query(properties=[('foo', 'baz')])
+    assert results['numberMatched'] == 0
+
+    results = p.query(properties=[('missing', 'bar')])
+    assert results['numberMatched'] == 0
+
+
+def test_query_bbox(fixture, config):
+    p = GeoJSONProvider(config)
+
+    results = p.query(bbox=[120, 5, 130, 15])
+    assert len(results['features']) == 1
+    assert results['numberMatched'] == 1
+
+    results = p.query(bbox=[120, 5, 0, 130, 15, 100])
+    assert results['numberMatched'] == 1
+
+    results = p.query(bbox=[-10, -10, 10, 10])
+    assert len(results['features']) == 0
+    assert results['numberMatched'] == 0
+
+    results = p.query(bbox=[120, 5, 130, 15], properties=[('foo', 'baz')])
+    assert results['numberMatched'] == 0
+
+    # antimeridian bbox
+    results = p.query(bbox=[120, 5, -170, 15])
+    assert results['numberMatched'] == 1
+
+    results = p.query(bbox=[120, 5, 0, -170, 15, 100])
+    assert results['numberMatched'] == 1
+
+    results = p.query(bbox=[170, 5, -170, 15])
+    assert results['numberMatched'] == 0
+
+
+def test_query_results_not_shared(fixture, config):
+    p = GeoJSONProvider(config)
+
+    results = p.query()
+    results['features'][0]['properties']['name'] = 'Null Island'
+    results['features'][0]['geometry'] = None
+
+    results = GeoJSONProvider(config).query()
+    assert 'Dinagat' in results['features'][0]['properties']['name']
+    assert results['features'][0]['geometry'] is not None
+
+
+def test_nested_values_not_shared(tmp_path, config):
+    data = {
+        'type': 'FeatureCollection',
+        'features': [{
+            'type': 'Feature',
+            'id': '123-456',
+            'geometry': {
+                'type': 'Point',
+                'coordinates': [125.6, 10.1]},
+            'links': [{'href': 'https://example.org', 'rel': 'related'}],
+            'properties': {
+                'name': 'Dinagat Islands',
+                'tags': ['x']
+            }}
+        ]
+    }
+    config['data'] = str(tmp_path / 'links.geojson')
+    with open(config['data'], 'w') as fh:
+        fh.write(json.dumps(data))
+
+    for _ in range(3):
+        feature = GeoJSONProvider(config).get('123-456')
+        feature['links'].extend([{'href': 'https://example.com'}])
+        feature['properties']['tags'].append('y')
+        feature['geometry']['coordinates'][0] = 0
+
+    for feature in (GeoJSONProvider(config).get('123-456'),
+                    GeoJSONProvider(config).query()['features'][0]):
+        assert len(feature['links']) == 1
+        assert feature['properties']['tags'] == ['x']
+        assert feature['geometry']['coordinates'] == [125.6, 10.1]
+
+
+def test_file_changed(fixture, config):
+    p = GeoJSONProvider(config)
+    assert p.query()['numberMatched'] == 1
+    assert p.query(bbox=[120, 5, 130, 15])['numberMatched'] == 1
+
+    with open(path) as fh:
+        data = json.load(fh)
+    data['features'].insert(0, {
+        'type': 'Feature',
+        'id': '789',
+        'geometry': {
+            'type': 'Point',
+            'coordinates': [0.0, 0.0]},
+        'properties': {
+            'name': 'Null Island'}})
+    with open(path, 'w') as fh:
+        fh.write(json.dumps(data))
+
+    p = GeoJSONProvider(config)
+    assert p.query()['numberMatched'] == 2
+    assert 'Null' in p.get('789')['properties']['name']
+
+    results = p.query(bbox=[120, 5, 130, 15])
+    assert results['numberMatched'] == 1
+    assert results['features'][0]['id'] == '123-456'
+
 
 def test_get(fixture, config):
     p = GeoJSONProvider(config)
@@ -276,6 +276,50 @@ def test_get_transform_from_crs():
     p_out = Point((473901.6105, 7462606.8762))
     assert p_out.equals_exact(transform_func(p_in), 1e-3)
 
+    p_in = Point((67.278972, 14.394493, 10.0))
+    p_out = Point((473901.6105, 7462606.8762, 10.0))
+    assert p_out.equals_exact(transform_func(p_in), 1e-3)
+    assert transform_func(p_in).has_z
+
+
+def test_crs_transform():
+    crs_transform_spec = util.CrsTransformSpec(
+        source_crs_uri='http://www.opengis.net/def/crs/EPSG/0/4258',
+        source_crs_wkt=util.get_crs_from_uri(
+            'http://www.opengis.net/def/crs/EPSG/0/4258').to_wkt(),
+        target_crs_uri='http://www.opengis.net/def/crs/EPSG/0/25833',
+        target_crs_wkt=util.get_crs_from_uri(
+            'http://www.opengis.net/def/crs/EPSG/0/25833').to_wkt(),
+    )
+
+    @util.crs_transform
+    def query(**kwargs):
+        return {
+            'type': 'FeatureCollection',
+            'features': [{
+                'type': 'Feature',
+                'geometry': {'type': 'Point',
+                             'coordinates': [67.278972, 14.394493]}
+            }, {
+                'type': 'Feature',
+                'geometry': {'type': 'Point',
+                             'coordinates': [67.278972, 14.394493, 10.0]}
+            }, {
+                'type': 'Feature',
+                'geometry': None
+            }]
+        }
+
+    features = query(crs_transform_spec=crs_transform_spec)['features']
+    p_out = Point((473901.6105, 7462606.8762))
+    assert p_out.equals_exact(
+        util.geojson_to_geom(features[0]['geometry']), 1e-3)
+    p_out = Point((473901.6105, 7462606.8762, 10.0))
+    assert p_out.equals_exact(
+        util.geojson_to_geom(features[1]['geometry']), 1e-3)
+    assert len(features[1]['geometry']['coordinates']) == 3
+    assert features[2]['geometry'] is None
+
 
 def test_get_supported_crs_list():
     DEFAULT_CRS_LIST = [